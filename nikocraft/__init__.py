@@ -19,6 +19,11 @@ from .window.vector2d import Vec
 from .window.vector3d import Vec3
 from .window.rgb import RGB
 from .window.rgb import RGBColor
+from .window.rgb import RGBColorArray
+from .window.rgb import nearest_color
+from .window.rgb import nearest_colors
+from .window.rgb import palette_table
+from .window.rgb import palette_index
 from .window.clock import Clock
 from .window.renderer import Renderer
 from .window.debug_screen import DebugScreen
@@ -40,6 +45,11 @@ __all__ = [
     "Vec3",
     "RGB",
     "RGBColor",
+    "RGBColorArray",
+    "nearest_color",
+    "nearest_colors",
+    "palette_table",
+    "palette_index",
     "Clock",
     "Renderer",
     "DebugScreen",
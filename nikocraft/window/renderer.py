@@ -24,7 +24,7 @@ class Renderer:
 
     @property
     def dimension(self) -> Vec:
-        return Vec(self.surface.get_width(), self.surface.get_height())
+        return Vec(*self.surface.get_size())
 
     # ABSTRACT METHODS
 
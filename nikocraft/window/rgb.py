@@ -6,15 +6,53 @@ Color source: https://www.webucator.com/article/python-color-constants-module/
 # Standard modules
 from typing import Union, Self
 
-# Local modules
-from ..utils.enum import Enum
+# External modules
+import pygame as pg
+import numpy as np
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+# Interned color instances (the palette below is finite, so equal colors share one object)
+_INTERN: dict[tuple[int, int, int], "RGBColor"] = {}
+
+# Prebuilt pygame colors (instances have no dict, so the cache lives here)
+_PG_COLORS: dict["RGBColor", pg.Color] = {}
+
+# Hoisted builtins for the construction hot path
+_tuple_new = tuple.__new__
+
+# Saturation lookup tables (channel sums live in [0, 510], differences
+# shifted by 255 in [0, 510] as well, so one byte table each replaces
+# the compare-and-branch clamping in the add/sub hot path)
+_SAT_ADD: bytes = bytes(min(i, 255) for i in range(511))
+_SAT_SUB: bytes = bytes(max(i - 255, 0) for i in range(511))
+
+# Byte value to hex digit pair lookup table
+_HEX: tuple[str, ...] = tuple(f"{i:02x}" for i in range(256))
 
 
 class RGBColor(tuple):
     """RGB color class"""
 
+    # No per-instance dict: a color is just the three tuple slots
+    __slots__ = ()
+
     def __new__(cls, red: int, green: int, blue: int) -> Self:
-        return tuple.__new__(cls, (round(red), round(green), round(blue)))
+        key = (red if type(red) is int else round(red),
+               green if type(green) is int else round(green),
+               blue if type(blue) is int else round(blue))
+        # Only the base class shares instances through the intern table -
+        # subclasses always get a fresh instance of their own type
+        if cls is not RGBColor:
+            return _tuple_new(cls, key)
+        color = _INTERN.get(key)
+        if color is None:
+            color = _tuple_new(cls, key)
+            _INTERN[key] = color
+        return color
 
     # PROPERTIES
 
@@ -32,15 +70,40 @@ class RGBColor(tuple):
 
     @property
     def hex(self) -> str:
-        return '#%02x%02x%02x' % self
+        red, green, blue = self
+        if 0 <= red <= 255 and 0 <= green <= 255 and 0 <= blue <= 255:
+            return "#" + _HEX[red] + _HEX[green] + _HEX[blue]
+        # Unclamped channels miss the table, format them like the baseline did
+        return "#%02x%02x%02x" % self
+
+    @property
+    def packed(self) -> int:
+        return (self[0] << 16) | (self[1] << 8) | self[2]
+
+    @property
+    def pgcolor(self) -> pg.Color:
+        color = _PG_COLORS.get(self)
+        if color is None:
+            color = pg.Color(self[0], self[1], self[2])
+            _PG_COLORS[self] = color
+        return color
 
     # CLASS METHODS
 
+    @classmethod
+    def _make(cls, red: int, green: int, blue: int) -> Self:
+        """Build a color from already rounded and clamped values (internal fast path)"""
+        return _tuple_new(cls, (red, green, blue))
+
     @classmethod
     def from_hex(cls, value: str) -> Self:
         """Convert a hex color string to RGB"""
-        value = value.replace("#", "").replace("0x", "")
-        return RGBColor(*(int(value[i:i+2], 16) for i in (0, 2, 4)))
+        return cls.from_packed(int(value.removeprefix("#").removeprefix("0x"), 16))
+
+    @classmethod
+    def from_packed(cls, value: int) -> Self:
+        """Convert a packed 0xRRGGBB integer to RGB"""
+        return cls((value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff)
 
     # METHODS
 
@@ -49,52 +112,100 @@ class RGBColor(tuple):
         return self[0], self[1], self[2], value
 
     def list(self) -> list[int]:
-        """Create a list with the red, green and blue values as elements"""
+        """Create a list with the red, green and blue values as elements
+
+        *Convenience for external use - allocates on every call,
+        hot code should index the color directly*
+        """
         return [*self]
 
     def dict(self, keys: tuple[str, str, str] = ("red", "green", "blue")) -> dict[str, int]:
-        """Create a dictionary with the x and y values as value of specific keys"""
+        """Create a dictionary with the x and y values as value of specific keys
+
+        *Convenience for external use - allocates on every call,
+        hot code should index the color directly*
+        """
         return {keys[0]: self[0], keys[1]: self[1], keys[2]: self[2]}
 
+    def intern(self) -> Self:
+        """Get the canonical shared instance for this color
+
+        Colors from the constructor are interned automatically; results of
+        arithmetic skip interning for speed, so intern colors that are kept
+        as dict keys or compared by identity -
+        Subclass instances are returned unchanged, the table is reserved
+        for plain RGBColor instances
+        """
+        if type(self) is not RGBColor:
+            return self
+        return _INTERN.setdefault((self[0], self[1], self[2]), self)
+
     def clamp(self) -> Self:
         """Clamp the values to be greater equals 0 and lower equals 255"""
-        clamped: list = self.list()
-        for i in range(3):
-            if clamped[i] < 0:
-                clamped[i] = 0
-            elif clamped[i] > 255:
-                clamped[i] = 255
-        return RGBColor(*clamped)
+        return RGBColor._make(min(255, max(0, self[0])), min(255, max(0, self[1])), min(255, max(0, self[2])))
 
     def mix(self, color: Self) -> Self:
         """Mix two RGB colors"""
-        return ((self + color) * 0.5).clamp()
+        # The average of two in-range channels can never leave [0, 255],
+        # but the constructor accepts unclamped values, so clamp the result
+        red = (self[0] + color[0]) >> 1
+        green = (self[1] + color[1]) >> 1
+        blue = (self[2] + color[2]) >> 1
+        return RGBColor._make(0 if red < 0 else 255 if red > 255 else red,
+                              0 if green < 0 else 255 if green > 255 else green,
+                              0 if blue < 0 else 255 if blue > 255 else blue)
 
     # OVERLOADS
 
-    def __eq__(self, other: Self) -> bool:
-        return self[0] == other[0] and self[1] == other[1] and self[2] == other[2]
-
-    def __ne__(self, other: Self) -> bool:
-        return self[0] != other[0] or self[1] != other[1] or self[2] != other[2]
-
     def __add__(self, other: Self) -> Self:
-        return RGBColor(self[0] + other[0], self[1] + other[1], self[2] + other[2]).clamp()
+        # Unclamped channels can push the sum outside the table, so bound
+        # the index (negative indices would silently wrap to the table end)
+        red = self[0] + other[0]
+        green = self[1] + other[1]
+        blue = self[2] + other[2]
+        return RGBColor._make(_SAT_ADD[red if 0 <= red <= 510 else 0 if red < 0 else 510],
+                              _SAT_ADD[green if 0 <= green <= 510 else 0 if green < 0 else 510],
+                              _SAT_ADD[blue if 0 <= blue <= 510 else 0 if blue < 0 else 510])
 
     def __sub__(self, other: Self) -> Self:
-        return RGBColor(self[0] - other[0], self[1] - other[1], self[2] - other[2]).clamp()
+        red = self[0] - other[0] + 255
+        green = self[1] - other[1] + 255
+        blue = self[2] - other[2] + 255
+        return RGBColor._make(_SAT_SUB[red if 0 <= red <= 510 else 0 if red < 0 else 510],
+                              _SAT_SUB[green if 0 <= green <= 510 else 0 if green < 0 else 510],
+                              _SAT_SUB[blue if 0 <= blue <= 510 else 0 if blue < 0 else 510])
 
     def __mul__(self, factor: Union[int, float]) -> Self:
-        return RGBColor(self[0] * factor, self[1] * factor, self[2] * factor).clamp()
+        red = round(self[0] * factor)
+        green = round(self[1] * factor)
+        blue = round(self[2] * factor)
+        return RGBColor._make(0 if red < 0 else 255 if red > 255 else red,
+                              0 if green < 0 else 255 if green > 255 else green,
+                              0 if blue < 0 else 255 if blue > 255 else blue)
 
     def __truediv__(self, divisor: Union[int, float]) -> Self:
-        return RGBColor(self[0] / divisor, self[1] / divisor, self[2] / divisor).clamp()
+        red = round(self[0] / divisor)
+        green = round(self[1] / divisor)
+        blue = round(self[2] / divisor)
+        return RGBColor._make(0 if red < 0 else 255 if red > 255 else red,
+                              0 if green < 0 else 255 if green > 255 else green,
+                              0 if blue < 0 else 255 if blue > 255 else blue)
 
     def __floordiv__(self, divisor: Union[int, float]) -> Self:
-        return RGBColor(self[0] // divisor, self[1] // divisor, self[2] // divisor).clamp()
+        red = round(self[0] // divisor)
+        green = round(self[1] // divisor)
+        blue = round(self[2] // divisor)
+        return RGBColor._make(0 if red < 0 else 255 if red > 255 else red,
+                              0 if green < 0 else 255 if green > 255 else green,
+                              0 if blue < 0 else 255 if blue > 255 else blue)
 
     def __pow__(self, power: float, modulo: float = None):
-        return RGBColor(pow(self[0], power, modulo), pow(self[1], power, modulo), pow(self[2], power, modulo)).clamp()
+        red = round(pow(self[0], power, modulo))
+        green = round(pow(self[1], power, modulo))
+        blue = round(pow(self[2], power, modulo))
+        return RGBColor._make(0 if red < 0 else 255 if red > 255 else red,
+                              0 if green < 0 else 255 if green > 255 else green,
+                              0 if blue < 0 else 255 if blue > 255 else blue)
 
     def __repr__(self) -> str:
         return f"RGB[id={id(self)}, red={self[0]}, green={self[1]}, blue={self[2]}]"
@@ -103,557 +214,769 @@ class RGBColor(tuple):
         return f"({self[0]}, {self[1]}, {self[2]})"
 
 
-class RGB(Enum):
-    """RGB color library enum"""
-
-    ALICEBLUE: RGBColor = RGBColor(240, 248, 255)
-    ANTIQUEWHITE: RGBColor = RGBColor(250, 235, 215)
-    ANTIQUEWHITE1: RGBColor = RGBColor(255, 239, 219)
-    ANTIQUEWHITE2: RGBColor = RGBColor(238, 223, 204)
-    ANTIQUEWHITE3: RGBColor = RGBColor(205, 192, 176)
-    ANTIQUEWHITE4: RGBColor = RGBColor(139, 131, 120)
-    AQUA: RGBColor = RGBColor(0, 255, 255)
-    AQUAMARINE1: RGBColor = RGBColor(127, 255, 212)
-    AQUAMARINE2: RGBColor = RGBColor(118, 238, 198)
-    AQUAMARINE3: RGBColor = RGBColor(102, 205, 170)
-    AQUAMARINE4: RGBColor = RGBColor(69, 139, 116)
-    AZURE1: RGBColor = RGBColor(240, 255, 255)
-    AZURE2: RGBColor = RGBColor(224, 238, 238)
-    AZURE3: RGBColor = RGBColor(193, 205, 205)
-    AZURE4: RGBColor = RGBColor(131, 139, 139)
-    BANANA: RGBColor = RGBColor(227, 207, 87)
-    BEIGE: RGBColor = RGBColor(245, 245, 220)
-    BISQUE1: RGBColor = RGBColor(255, 228, 196)
-    BISQUE2: RGBColor = RGBColor(238, 213, 183)
-    BISQUE3: RGBColor = RGBColor(205, 183, 158)
-    BISQUE4: RGBColor = RGBColor(139, 125, 107)
-    BLACK: RGBColor = RGBColor(0, 0, 0)
-    BLANCHEDALMOND: RGBColor = RGBColor(255, 235, 205)
-    BLUE: RGBColor = RGBColor(0, 0, 255)
-    BLUE2: RGBColor = RGBColor(0, 0, 238)
-    BLUE3: RGBColor = RGBColor(0, 0, 205)
-    BLUE4: RGBColor = RGBColor(0, 0, 139)
-    BLUEVIOLET: RGBColor = RGBColor(138, 43, 226)
-    BRICK: RGBColor = RGBColor(156, 102, 31)
-    BROWN: RGBColor = RGBColor(165, 42, 42)
-    BROWN1: RGBColor = RGBColor(255, 64, 64)
-    BROWN2: RGBColor = RGBColor(238, 59, 59)
-    BROWN3: RGBColor = RGBColor(205, 51, 51)
-    BROWN4: RGBColor = RGBColor(139, 35, 35)
-    BURLYWOOD: RGBColor = RGBColor(222, 184, 135)
-    BURLYWOOD1: RGBColor = RGBColor(255, 211, 155)
-    BURLYWOOD2: RGBColor = RGBColor(238, 197, 145)
-    BURLYWOOD3: RGBColor = RGBColor(205, 170, 125)
-    BURLYWOOD4: RGBColor = RGBColor(139, 115, 85)
-    BURNTSIENNA: RGBColor = RGBColor(138, 54, 15)
-    BURNTUMBER: RGBColor = RGBColor(138, 51, 36)
-    CADETBLUE: RGBColor = RGBColor(95, 158, 160)
-    CADETBLUE1: RGBColor = RGBColor(152, 245, 255)
-    CADETBLUE2: RGBColor = RGBColor(142, 229, 238)
-    CADETBLUE3: RGBColor = RGBColor(122, 197, 205)
-    CADETBLUE4: RGBColor = RGBColor(83, 134, 139)
-    CADMIUMORANGE: RGBColor = RGBColor(255, 97, 3)
-    CADMIUMYELLOW: RGBColor = RGBColor(255, 153, 18)
-    CARROT: RGBColor = RGBColor(237, 145, 33)
-    CHARTREUSE1: RGBColor = RGBColor(127, 255, 0)
-    CHARTREUSE2: RGBColor = RGBColor(118, 238, 0)
-    CHARTREUSE3: RGBColor = RGBColor(102, 205, 0)
-    CHARTREUSE4: RGBColor = RGBColor(69, 139, 0)
-    CHOCOLATE: RGBColor = RGBColor(210, 105, 30)
-    CHOCOLATE1: RGBColor = RGBColor(255, 127, 36)
-    CHOCOLATE2: RGBColor = RGBColor(238, 118, 33)
-    CHOCOLATE3: RGBColor = RGBColor(205, 102, 29)
-    CHOCOLATE4: RGBColor = RGBColor(139, 69, 19)
-    COBALT: RGBColor = RGBColor(61, 89, 171)
-    COBALTGREEN: RGBColor = RGBColor(61, 145, 64)
-    COLDGREY: RGBColor = RGBColor(128, 138, 135)
-    CORAL: RGBColor = RGBColor(255, 127, 80)
-    CORAL1: RGBColor = RGBColor(255, 114, 86)
-    CORAL2: RGBColor = RGBColor(238, 106, 80)
-    CORAL3: RGBColor = RGBColor(205, 91, 69)
-    CORAL4: RGBColor = RGBColor(139, 62, 47)
-    CORNFLOWERBLUE: RGBColor = RGBColor(100, 149, 237)
-    CORNSILK1: RGBColor = RGBColor(255, 248, 220)
-    CORNSILK2: RGBColor = RGBColor(238, 232, 205)
-    CORNSILK3: RGBColor = RGBColor(205, 200, 177)
-    CORNSILK4: RGBColor = RGBColor(139, 136, 120)
-    CRIMSON: RGBColor = RGBColor(220, 20, 60)
-    CYAN2: RGBColor = RGBColor(0, 238, 238)
-    CYAN3: RGBColor = RGBColor(0, 205, 205)
-    CYAN4: RGBColor = RGBColor(0, 139, 139)
-    DARKGOLDENROD: RGBColor = RGBColor(184, 134, 11)
-    DARKGOLDENROD1: RGBColor = RGBColor(255, 185, 15)
-    DARKGOLDENROD2: RGBColor = RGBColor(238, 173, 14)
-    DARKGOLDENROD3: RGBColor = RGBColor(205, 149, 12)
-    DARKGOLDENROD4: RGBColor = RGBColor(139, 101, 8)
-    DARKGRAY: RGBColor = RGBColor(169, 169, 169)
-    DARKGREEN: RGBColor = RGBColor(0, 100, 0)
-    DARKKHAKI: RGBColor = RGBColor(189, 183, 107)
-    DARKOLIVEGREEN: RGBColor = RGBColor(85, 107, 47)
-    DARKOLIVEGREEN1: RGBColor = RGBColor(202, 255, 112)
-    DARKOLIVEGREEN2: RGBColor = RGBColor(188, 238, 104)
-    DARKOLIVEGREEN3: RGBColor = RGBColor(162, 205, 90)
-    DARKOLIVEGREEN4: RGBColor = RGBColor(110, 139, 61)
-    DARKORANGE: RGBColor = RGBColor(255, 140, 0)
-    DARKORANGE1: RGBColor = RGBColor(255, 127, 0)
-    DARKORANGE2: RGBColor = RGBColor(238, 118, 0)
-    DARKORANGE3: RGBColor = RGBColor(205, 102, 0)
-    DARKORANGE4: RGBColor = RGBColor(139, 69, 0)
-    DARKORCHID: RGBColor = RGBColor(153, 50, 204)
-    DARKORCHID1: RGBColor = RGBColor(191, 62, 255)
-    DARKORCHID2: RGBColor = RGBColor(178, 58, 238)
-    DARKORCHID3: RGBColor = RGBColor(154, 50, 205)
-    DARKORCHID4: RGBColor = RGBColor(104, 34, 139)
-    DARKSALMON: RGBColor = RGBColor(233, 150, 122)
-    DARKSEAGREEN: RGBColor = RGBColor(143, 188, 143)
-    DARKSEAGREEN1: RGBColor = RGBColor(193, 255, 193)
-    DARKSEAGREEN2: RGBColor = RGBColor(180, 238, 180)
-    DARKSEAGREEN3: RGBColor = RGBColor(155, 205, 155)
-    DARKSEAGREEN4: RGBColor = RGBColor(105, 139, 105)
-    DARKSLATEBLUE: RGBColor = RGBColor(72, 61, 139)
-    DARKSLATEGRAY: RGBColor = RGBColor(47, 79, 79)
-    DARKSLATEGRAY1: RGBColor = RGBColor(151, 255, 255)
-    DARKSLATEGRAY2: RGBColor = RGBColor(141, 238, 238)
-    DARKSLATEGRAY3: RGBColor = RGBColor(121, 205, 205)
-    DARKSLATEGRAY4: RGBColor = RGBColor(82, 139, 139)
-    DARKTURQUOISE: RGBColor = RGBColor(0, 206, 209)
-    DARKVIOLET: RGBColor = RGBColor(148, 0, 211)
-    DEEPPINK1: RGBColor = RGBColor(255, 20, 147)
-    DEEPPINK2: RGBColor = RGBColor(238, 18, 137)
-    DEEPPINK3: RGBColor = RGBColor(205, 16, 118)
-    DEEPPINK4: RGBColor = RGBColor(139, 10, 80)
-    DEEPSKYBLUE1: RGBColor = RGBColor(0, 191, 255)
-    DEEPSKYBLUE2: RGBColor = RGBColor(0, 178, 238)
-    DEEPSKYBLUE3: RGBColor = RGBColor(0, 154, 205)
-    DEEPSKYBLUE4: RGBColor = RGBColor(0, 104, 139)
-    DIMGRAY: RGBColor = RGBColor(105, 105, 105)
-    DODGERBLUE1: RGBColor = RGBColor(30, 144, 255)
-    DODGERBLUE2: RGBColor = RGBColor(28, 134, 238)
-    DODGERBLUE3: RGBColor = RGBColor(24, 116, 205)
-    DODGERBLUE4: RGBColor = RGBColor(16, 78, 139)
-    EGGSHELL: RGBColor = RGBColor(252, 230, 201)
-    EMERALDGREEN: RGBColor = RGBColor(0, 201, 87)
-    FIREBRICK: RGBColor = RGBColor(178, 34, 34)
-    FIREBRICK1: RGBColor = RGBColor(255, 48, 48)
-    FIREBRICK2: RGBColor = RGBColor(238, 44, 44)
-    FIREBRICK3: RGBColor = RGBColor(205, 38, 38)
-    FIREBRICK4: RGBColor = RGBColor(139, 26, 26)
-    FLESH: RGBColor = RGBColor(255, 125, 64)
-    FLORALWHITE: RGBColor = RGBColor(255, 250, 240)
-    FORESTGREEN: RGBColor = RGBColor(34, 139, 34)
-    GAINSBORO: RGBColor = RGBColor(220, 220, 220)
-    GHOSTWHITE: RGBColor = RGBColor(248, 248, 255)
-    GOLD1: RGBColor = RGBColor(255, 215, 0)
-    GOLD2: RGBColor = RGBColor(238, 201, 0)
-    GOLD3: RGBColor = RGBColor(205, 173, 0)
-    GOLD4: RGBColor = RGBColor(139, 117, 0)
-    GOLDENROD: RGBColor = RGBColor(218, 165, 32)
-    GOLDENROD1: RGBColor = RGBColor(255, 193, 37)
-    GOLDENROD2: RGBColor = RGBColor(238, 180, 34)
-    GOLDENROD3: RGBColor = RGBColor(205, 155, 29)
-    GOLDENROD4: RGBColor = RGBColor(139, 105, 20)
-    GRAY: RGBColor = RGBColor(128, 128, 128)
-    GRAY1: RGBColor = RGBColor(3, 3, 3)
-    GRAY10: RGBColor = RGBColor(26, 26, 26)
-    GRAY11: RGBColor = RGBColor(28, 28, 28)
-    GRAY12: RGBColor = RGBColor(31, 31, 31)
-    GRAY13: RGBColor = RGBColor(33, 33, 33)
-    GRAY14: RGBColor = RGBColor(36, 36, 36)
-    GRAY15: RGBColor = RGBColor(38, 38, 38)
-    GRAY16: RGBColor = RGBColor(41, 41, 41)
-    GRAY17: RGBColor = RGBColor(43, 43, 43)
-    GRAY18: RGBColor = RGBColor(46, 46, 46)
-    GRAY19: RGBColor = RGBColor(48, 48, 48)
-    GRAY2: RGBColor = RGBColor(5, 5, 5)
-    GRAY20: RGBColor = RGBColor(51, 51, 51)
-    GRAY21: RGBColor = RGBColor(54, 54, 54)
-    GRAY22: RGBColor = RGBColor(56, 56, 56)
-    GRAY23: RGBColor = RGBColor(59, 59, 59)
-    GRAY24: RGBColor = RGBColor(61, 61, 61)
-    GRAY25: RGBColor = RGBColor(64, 64, 64)
-    GRAY26: RGBColor = RGBColor(66, 66, 66)
-    GRAY27: RGBColor = RGBColor(69, 69, 69)
-    GRAY28: RGBColor = RGBColor(71, 71, 71)
-    GRAY29: RGBColor = RGBColor(74, 74, 74)
-    GRAY3: RGBColor = RGBColor(8, 8, 8)
-    GRAY30: RGBColor = RGBColor(77, 77, 77)
-    GRAY31: RGBColor = RGBColor(79, 79, 79)
-    GRAY32: RGBColor = RGBColor(82, 82, 82)
-    GRAY33: RGBColor = RGBColor(84, 84, 84)
-    GRAY34: RGBColor = RGBColor(87, 87, 87)
-    GRAY35: RGBColor = RGBColor(89, 89, 89)
-    GRAY36: RGBColor = RGBColor(92, 92, 92)
-    GRAY37: RGBColor = RGBColor(94, 94, 94)
-    GRAY38: RGBColor = RGBColor(97, 97, 97)
-    GRAY39: RGBColor = RGBColor(99, 99, 99)
-    GRAY4: RGBColor = RGBColor(10, 10, 10)
-    GRAY40: RGBColor = RGBColor(102, 102, 102)
-    GRAY42: RGBColor = RGBColor(107, 107, 107)
-    GRAY43: RGBColor = RGBColor(110, 110, 110)
-    GRAY44: RGBColor = RGBColor(112, 112, 112)
-    GRAY45: RGBColor = RGBColor(115, 115, 115)
-    GRAY46: RGBColor = RGBColor(117, 117, 117)
-    GRAY47: RGBColor = RGBColor(120, 120, 120)
-    GRAY48: RGBColor = RGBColor(122, 122, 122)
-    GRAY49: RGBColor = RGBColor(125, 125, 125)
-    GRAY5: RGBColor = RGBColor(13, 13, 13)
-    GRAY50: RGBColor = RGBColor(127, 127, 127)
-    GRAY51: RGBColor = RGBColor(130, 130, 130)
-    GRAY52: RGBColor = RGBColor(133, 133, 133)
-    GRAY53: RGBColor = RGBColor(135, 135, 135)
-    GRAY54: RGBColor = RGBColor(138, 138, 138)
-    GRAY55: RGBColor = RGBColor(140, 140, 140)
-    GRAY56: RGBColor = RGBColor(143, 143, 143)
-    GRAY57: RGBColor = RGBColor(145, 145, 145)
-    GRAY58: RGBColor = RGBColor(148, 148, 148)
-    GRAY59: RGBColor = RGBColor(150, 150, 150)
-    GRAY6: RGBColor = RGBColor(15, 15, 15)
-    GRAY60: RGBColor = RGBColor(153, 153, 153)
-    GRAY61: RGBColor = RGBColor(156, 156, 156)
-    GRAY62: RGBColor = RGBColor(158, 158, 158)
-    GRAY63: RGBColor = RGBColor(161, 161, 161)
-    GRAY64: RGBColor = RGBColor(163, 163, 163)
-    GRAY65: RGBColor = RGBColor(166, 166, 166)
-    GRAY66: RGBColor = RGBColor(168, 168, 168)
-    GRAY67: RGBColor = RGBColor(171, 171, 171)
-    GRAY68: RGBColor = RGBColor(173, 173, 173)
-    GRAY69: RGBColor = RGBColor(176, 176, 176)
-    GRAY7: RGBColor = RGBColor(18, 18, 18)
-    GRAY70: RGBColor = RGBColor(179, 179, 179)
-    GRAY71: RGBColor = RGBColor(181, 181, 181)
-    GRAY72: RGBColor = RGBColor(184, 184, 184)
-    GRAY73: RGBColor = RGBColor(186, 186, 186)
-    GRAY74: RGBColor = RGBColor(189, 189, 189)
-    GRAY75: RGBColor = RGBColor(191, 191, 191)
-    GRAY76: RGBColor = RGBColor(194, 194, 194)
-    GRAY77: RGBColor = RGBColor(196, 196, 196)
-    GRAY78: RGBColor = RGBColor(199, 199, 199)
-    GRAY79: RGBColor = RGBColor(201, 201, 201)
-    GRAY8: RGBColor = RGBColor(20, 20, 20)
-    GRAY80: RGBColor = RGBColor(204, 204, 204)
-    GRAY81: RGBColor = RGBColor(207, 207, 207)
-    GRAY82: RGBColor = RGBColor(209, 209, 209)
-    GRAY83: RGBColor = RGBColor(212, 212, 212)
-    GRAY84: RGBColor = RGBColor(214, 214, 214)
-    GRAY85: RGBColor = RGBColor(217, 217, 217)
-    GRAY86: RGBColor = RGBColor(219, 219, 219)
-    GRAY87: RGBColor = RGBColor(222, 222, 222)
-    GRAY88: RGBColor = RGBColor(224, 224, 224)
-    GRAY89: RGBColor = RGBColor(227, 227, 227)
-    GRAY9: RGBColor = RGBColor(23, 23, 23)
-    GRAY90: RGBColor = RGBColor(229, 229, 229)
-    GRAY91: RGBColor = RGBColor(232, 232, 232)
-    GRAY92: RGBColor = RGBColor(235, 235, 235)
-    GRAY93: RGBColor = RGBColor(237, 237, 237)
-    GRAY94: RGBColor = RGBColor(240, 240, 240)
-    GRAY95: RGBColor = RGBColor(242, 242, 242)
-    GRAY97: RGBColor = RGBColor(247, 247, 247)
-    GRAY98: RGBColor = RGBColor(250, 250, 250)
-    GRAY99: RGBColor = RGBColor(252, 252, 252)
-    GREEN: RGBColor = RGBColor(0, 128, 0)
-    GREEN1: RGBColor = RGBColor(0, 255, 0)
-    GREEN2: RGBColor = RGBColor(0, 238, 0)
-    GREEN3: RGBColor = RGBColor(0, 205, 0)
-    GREEN4: RGBColor = RGBColor(0, 139, 0)
-    GREENYELLOW: RGBColor = RGBColor(173, 255, 47)
-    HONEYDEW1: RGBColor = RGBColor(240, 255, 240)
-    HONEYDEW2: RGBColor = RGBColor(224, 238, 224)
-    HONEYDEW3: RGBColor = RGBColor(193, 205, 193)
-    HONEYDEW4: RGBColor = RGBColor(131, 139, 131)
-    HOTPINK: RGBColor = RGBColor(255, 105, 180)
-    HOTPINK1: RGBColor = RGBColor(255, 110, 180)
-    HOTPINK2: RGBColor = RGBColor(238, 106, 167)
-    HOTPINK3: RGBColor = RGBColor(205, 96, 144)
-    HOTPINK4: RGBColor = RGBColor(139, 58, 98)
-    INDIANRED: RGBColor = RGBColor(205, 92, 92)
-    INDIANRED1: RGBColor = RGBColor(255, 106, 106)
-    INDIANRED2: RGBColor = RGBColor(238, 99, 99)
-    INDIANRED3: RGBColor = RGBColor(205, 85, 85)
-    INDIANRED4: RGBColor = RGBColor(139, 58, 58)
-    INDIGO: RGBColor = RGBColor(75, 0, 130)
-    IVORY1: RGBColor = RGBColor(255, 255, 240)
-    IVORY2: RGBColor = RGBColor(238, 238, 224)
-    IVORY3: RGBColor = RGBColor(205, 205, 193)
-    IVORY4: RGBColor = RGBColor(139, 139, 131)
-    IVORYBLACK: RGBColor = RGBColor(41, 36, 33)
-    KHAKI: RGBColor = RGBColor(240, 230, 140)
-    KHAKI1: RGBColor = RGBColor(255, 246, 143)
-    KHAKI2: RGBColor = RGBColor(238, 230, 133)
-    KHAKI3: RGBColor = RGBColor(205, 198, 115)
-    KHAKI4: RGBColor = RGBColor(139, 134, 78)
-    LAVENDER: RGBColor = RGBColor(230, 230, 250)
-    LAVENDERBLUSH1: RGBColor = RGBColor(255, 240, 245)
-    LAVENDERBLUSH2: RGBColor = RGBColor(238, 224, 229)
-    LAVENDERBLUSH3: RGBColor = RGBColor(205, 193, 197)
-    LAVENDERBLUSH4: RGBColor = RGBColor(139, 131, 134)
-    LAWNGREEN: RGBColor = RGBColor(124, 252, 0)
-    LEMONCHIFFON1: RGBColor = RGBColor(255, 250, 205)
-    LEMONCHIFFON2: RGBColor = RGBColor(238, 233, 191)
-    LEMONCHIFFON3: RGBColor = RGBColor(205, 201, 165)
-    LEMONCHIFFON4: RGBColor = RGBColor(139, 137, 112)
-    LIGHTBLUE: RGBColor = RGBColor(173, 216, 230)
-    LIGHTBLUE1: RGBColor = RGBColor(191, 239, 255)
-    LIGHTBLUE2: RGBColor = RGBColor(178, 223, 238)
-    LIGHTBLUE3: RGBColor = RGBColor(154, 192, 205)
-    LIGHTBLUE4: RGBColor = RGBColor(104, 131, 139)
-    LIGHTCORAL: RGBColor = RGBColor(240, 128, 128)
-    LIGHTCYAN1: RGBColor = RGBColor(224, 255, 255)
-    LIGHTCYAN2: RGBColor = RGBColor(209, 238, 238)
-    LIGHTCYAN3: RGBColor = RGBColor(180, 205, 205)
-    LIGHTCYAN4: RGBColor = RGBColor(122, 139, 139)
-    LIGHTGOLDENROD1: RGBColor = RGBColor(255, 236, 139)
-    LIGHTGOLDENROD2: RGBColor = RGBColor(238, 220, 130)
-    LIGHTGOLDENROD3: RGBColor = RGBColor(205, 190, 112)
-    LIGHTGOLDENROD4: RGBColor = RGBColor(139, 129, 76)
-    LIGHTGOLDENRODYELLOW: RGBColor = RGBColor(250, 250, 210)
-    LIGHTGREY: RGBColor = RGBColor(211, 211, 211)
-    LIGHTPINK: RGBColor = RGBColor(255, 182, 193)
-    LIGHTPINK1: RGBColor = RGBColor(255, 174, 185)
-    LIGHTPINK2: RGBColor = RGBColor(238, 162, 173)
-    LIGHTPINK3: RGBColor = RGBColor(205, 140, 149)
-    LIGHTPINK4: RGBColor = RGBColor(139, 95, 101)
-    LIGHTSALMON1: RGBColor = RGBColor(255, 160, 122)
-    LIGHTSALMON2: RGBColor = RGBColor(238, 149, 114)
-    LIGHTSALMON3: RGBColor = RGBColor(205, 129, 98)
-    LIGHTSALMON4: RGBColor = RGBColor(139, 87, 66)
-    LIGHTSEAGREEN: RGBColor = RGBColor(32, 178, 170)
-    LIGHTSKYBLUE: RGBColor = RGBColor(135, 206, 250)
-    LIGHTSKYBLUE1: RGBColor = RGBColor(176, 226, 255)
-    LIGHTSKYBLUE2: RGBColor = RGBColor(164, 211, 238)
-    LIGHTSKYBLUE3: RGBColor = RGBColor(141, 182, 205)
-    LIGHTSKYBLUE4: RGBColor = RGBColor(96, 123, 139)
-    LIGHTSLATEBLUE: RGBColor = RGBColor(132, 112, 255)
-    LIGHTSLATEGRAY: RGBColor = RGBColor(119, 136, 153)
-    LIGHTSTEELBLUE: RGBColor = RGBColor(176, 196, 222)
-    LIGHTSTEELBLUE1: RGBColor = RGBColor(202, 225, 255)
-    LIGHTSTEELBLUE2: RGBColor = RGBColor(188, 210, 238)
-    LIGHTSTEELBLUE3: RGBColor = RGBColor(162, 181, 205)
-    LIGHTSTEELBLUE4: RGBColor = RGBColor(110, 123, 139)
-    LIGHTYELLOW1: RGBColor = RGBColor(255, 255, 224)
-    LIGHTYELLOW2: RGBColor = RGBColor(238, 238, 209)
-    LIGHTYELLOW3: RGBColor = RGBColor(205, 205, 180)
-    LIGHTYELLOW4: RGBColor = RGBColor(139, 139, 122)
-    LIMEGREEN: RGBColor = RGBColor(50, 205, 50)
-    LINEN: RGBColor = RGBColor(250, 240, 230)
-    MAGENTA: RGBColor = RGBColor(255, 0, 255)
-    MAGENTA2: RGBColor = RGBColor(238, 0, 238)
-    MAGENTA3: RGBColor = RGBColor(205, 0, 205)
-    MAGENTA4: RGBColor = RGBColor(139, 0, 139)
-    MANGANESEBLUE: RGBColor = RGBColor(3, 168, 158)
-    MAROON: RGBColor = RGBColor(128, 0, 0)
-    MAROON1: RGBColor = RGBColor(255, 52, 179)
-    MAROON2: RGBColor = RGBColor(238, 48, 167)
-    MAROON3: RGBColor = RGBColor(205, 41, 144)
-    MAROON4: RGBColor = RGBColor(139, 28, 98)
-    MEDIUMORCHID: RGBColor = RGBColor(186, 85, 211)
-    MEDIUMORCHID1: RGBColor = RGBColor(224, 102, 255)
-    MEDIUMORCHID2: RGBColor = RGBColor(209, 95, 238)
-    MEDIUMORCHID3: RGBColor = RGBColor(180, 82, 205)
-    MEDIUMORCHID4: RGBColor = RGBColor(122, 55, 139)
-    MEDIUMPURPLE: RGBColor = RGBColor(147, 112, 219)
-    MEDIUMPURPLE1: RGBColor = RGBColor(171, 130, 255)
-    MEDIUMPURPLE2: RGBColor = RGBColor(159, 121, 238)
-    MEDIUMPURPLE3: RGBColor = RGBColor(137, 104, 205)
-    MEDIUMPURPLE4: RGBColor = RGBColor(93, 71, 139)
-    MEDIUMSEAGREEN: RGBColor = RGBColor(60, 179, 113)
-    MEDIUMSLATEBLUE: RGBColor = RGBColor(123, 104, 238)
-    MEDIUMSPRINGGREEN: RGBColor = RGBColor(0, 250, 154)
-    MEDIUMTURQUOISE: RGBColor = RGBColor(72, 209, 204)
-    MEDIUMVIOLETRED: RGBColor = RGBColor(199, 21, 133)
-    MELON: RGBColor = RGBColor(227, 168, 105)
-    MIDNIGHTBLUE: RGBColor = RGBColor(25, 25, 112)
-    MINT: RGBColor = RGBColor(189, 252, 201)
-    MINTCREAM: RGBColor = RGBColor(245, 255, 250)
-    MISTYROSE1: RGBColor = RGBColor(255, 228, 225)
-    MISTYROSE2: RGBColor = RGBColor(238, 213, 210)
-    MISTYROSE3: RGBColor = RGBColor(205, 183, 181)
-    MISTYROSE4: RGBColor = RGBColor(139, 125, 123)
-    MOCCASIN: RGBColor = RGBColor(255, 228, 181)
-    NAVAJOWHITE1: RGBColor = RGBColor(255, 222, 173)
-    NAVAJOWHITE2: RGBColor = RGBColor(238, 207, 161)
-    NAVAJOWHITE3: RGBColor = RGBColor(205, 179, 139)
-    NAVAJOWHITE4: RGBColor = RGBColor(139, 121, 94)
-    NAVY: RGBColor = RGBColor(0, 0, 128)
-    OLDLACE: RGBColor = RGBColor(253, 245, 230)
-    OLIVE: RGBColor = RGBColor(128, 128, 0)
-    OLIVEDRAB: RGBColor = RGBColor(107, 142, 35)
-    OLIVEDRAB1: RGBColor = RGBColor(192, 255, 62)
-    OLIVEDRAB2: RGBColor = RGBColor(179, 238, 58)
-    OLIVEDRAB3: RGBColor = RGBColor(154, 205, 50)
-    OLIVEDRAB4: RGBColor = RGBColor(105, 139, 34)
-    ORANGE: RGBColor = RGBColor(255, 128, 0)
-    ORANGE1: RGBColor = RGBColor(255, 165, 0)
-    ORANGE2: RGBColor = RGBColor(238, 154, 0)
-    ORANGE3: RGBColor = RGBColor(205, 133, 0)
-    ORANGE4: RGBColor = RGBColor(139, 90, 0)
-    ORANGERED1: RGBColor = RGBColor(255, 69, 0)
-    ORANGERED2: RGBColor = RGBColor(238, 64, 0)
-    ORANGERED3: RGBColor = RGBColor(205, 55, 0)
-    ORANGERED4: RGBColor = RGBColor(139, 37, 0)
-    ORCHID: RGBColor = RGBColor(218, 112, 214)
-    ORCHID1: RGBColor = RGBColor(255, 131, 250)
-    ORCHID2: RGBColor = RGBColor(238, 122, 233)
-    ORCHID3: RGBColor = RGBColor(205, 105, 201)
-    ORCHID4: RGBColor = RGBColor(139, 71, 137)
-    PALEGOLDENROD: RGBColor = RGBColor(238, 232, 170)
-    PALEGREEN: RGBColor = RGBColor(152, 251, 152)
-    PALEGREEN1: RGBColor = RGBColor(154, 255, 154)
-    PALEGREEN2: RGBColor = RGBColor(144, 238, 144)
-    PALEGREEN3: RGBColor = RGBColor(124, 205, 124)
-    PALEGREEN4: RGBColor = RGBColor(84, 139, 84)
-    PALETURQUOISE1: RGBColor = RGBColor(187, 255, 255)
-    PALETURQUOISE2: RGBColor = RGBColor(174, 238, 238)
-    PALETURQUOISE3: RGBColor = RGBColor(150, 205, 205)
-    PALETURQUOISE4: RGBColor = RGBColor(102, 139, 139)
-    PALEVIOLETRED: RGBColor = RGBColor(219, 112, 147)
-    PALEVIOLETRED1: RGBColor = RGBColor(255, 130, 171)
-    PALEVIOLETRED2: RGBColor = RGBColor(238, 121, 159)
-    PALEVIOLETRED3: RGBColor = RGBColor(205, 104, 137)
-    PALEVIOLETRED4: RGBColor = RGBColor(139, 71, 93)
-    PAPAYAWHIP: RGBColor = RGBColor(255, 239, 213)
-    PEACHPUFF1: RGBColor = RGBColor(255, 218, 185)
-    PEACHPUFF2: RGBColor = RGBColor(238, 203, 173)
-    PEACHPUFF3: RGBColor = RGBColor(205, 175, 149)
-    PEACHPUFF4: RGBColor = RGBColor(139, 119, 101)
-    PEACOCK: RGBColor = RGBColor(51, 161, 201)
-    PINK: RGBColor = RGBColor(255, 192, 203)
-    PINK1: RGBColor = RGBColor(255, 181, 197)
-    PINK2: RGBColor = RGBColor(238, 169, 184)
-    PINK3: RGBColor = RGBColor(205, 145, 158)
-    PINK4: RGBColor = RGBColor(139, 99, 108)
-    PLUM: RGBColor = RGBColor(221, 160, 221)
-    PLUM1: RGBColor = RGBColor(255, 187, 255)
-    PLUM2: RGBColor = RGBColor(238, 174, 238)
-    PLUM3: RGBColor = RGBColor(205, 150, 205)
-    PLUM4: RGBColor = RGBColor(139, 102, 139)
-    POWDERBLUE: RGBColor = RGBColor(176, 224, 230)
-    PURPLE: RGBColor = RGBColor(128, 0, 128)
-    PURPLE1: RGBColor = RGBColor(155, 48, 255)
-    PURPLE2: RGBColor = RGBColor(145, 44, 238)
-    PURPLE3: RGBColor = RGBColor(125, 38, 205)
-    PURPLE4: RGBColor = RGBColor(85, 26, 139)
-    RASPBERRY: RGBColor = RGBColor(135, 38, 87)
-    RAWSIENNA: RGBColor = RGBColor(199, 97, 20)
-    RED1: RGBColor = RGBColor(255, 0, 0)
-    RED2: RGBColor = RGBColor(238, 0, 0)
-    RED3: RGBColor = RGBColor(205, 0, 0)
-    RED4: RGBColor = RGBColor(139, 0, 0)
-    ROSYBROWN: RGBColor = RGBColor(188, 143, 143)
-    ROSYBROWN1: RGBColor = RGBColor(255, 193, 193)
-    ROSYBROWN2: RGBColor = RGBColor(238, 180, 180)
-    ROSYBROWN3: RGBColor = RGBColor(205, 155, 155)
-    ROSYBROWN4: RGBColor = RGBColor(139, 105, 105)
-    ROYALBLUE: RGBColor = RGBColor(65, 105, 225)
-    ROYALBLUE1: RGBColor = RGBColor(72, 118, 255)
-    ROYALBLUE2: RGBColor = RGBColor(67, 110, 238)
-    ROYALBLUE3: RGBColor = RGBColor(58, 95, 205)
-    ROYALBLUE4: RGBColor = RGBColor(39, 64, 139)
-    SALMON: RGBColor = RGBColor(250, 128, 114)
-    SALMON1: RGBColor = RGBColor(255, 140, 105)
-    SALMON2: RGBColor = RGBColor(238, 130, 98)
-    SALMON3: RGBColor = RGBColor(205, 112, 84)
-    SALMON4: RGBColor = RGBColor(139, 76, 57)
-    SANDYBROWN: RGBColor = RGBColor(244, 164, 96)
-    SAPGREEN: RGBColor = RGBColor(48, 128, 20)
-    SEAGREEN1: RGBColor = RGBColor(84, 255, 159)
-    SEAGREEN2: RGBColor = RGBColor(78, 238, 148)
-    SEAGREEN3: RGBColor = RGBColor(67, 205, 128)
-    SEAGREEN4: RGBColor = RGBColor(46, 139, 87)
-    SEASHELL1: RGBColor = RGBColor(255, 245, 238)
-    SEASHELL2: RGBColor = RGBColor(238, 229, 222)
-    SEASHELL3: RGBColor = RGBColor(205, 197, 191)
-    SEASHELL4: RGBColor = RGBColor(139, 134, 130)
-    SEPIA: RGBColor = RGBColor(94, 38, 18)
-    SGIBEET: RGBColor = RGBColor(142, 56, 142)
-    SGIBRIGHTGRAY: RGBColor = RGBColor(197, 193, 170)
-    SGICHARTREUSE: RGBColor = RGBColor(113, 198, 113)
-    SGIDARKGRAY: RGBColor = RGBColor(85, 85, 85)
-    SGIGRAY12: RGBColor = RGBColor(30, 30, 30)
-    SGIGRAY16: RGBColor = RGBColor(40, 40, 40)
-    SGIGRAY32: RGBColor = RGBColor(81, 81, 81)
-    SGIGRAY36: RGBColor = RGBColor(91, 91, 91)
-    SGIGRAY52: RGBColor = RGBColor(132, 132, 132)
-    SGIGRAY56: RGBColor = RGBColor(142, 142, 142)
-    SGIGRAY72: RGBColor = RGBColor(183, 183, 183)
-    SGIGRAY76: RGBColor = RGBColor(193, 193, 193)
-    SGIGRAY92: RGBColor = RGBColor(234, 234, 234)
-    SGIGRAY96: RGBColor = RGBColor(244, 244, 244)
-    SGILIGHTBLUE: RGBColor = RGBColor(125, 158, 192)
-    SGILIGHTGRAY: RGBColor = RGBColor(170, 170, 170)
-    SGIOLIVEDRAB: RGBColor = RGBColor(142, 142, 56)
-    SGISALMON: RGBColor = RGBColor(198, 113, 113)
-    SGISLATEBLUE: RGBColor = RGBColor(113, 113, 198)
-    SGITEAL: RGBColor = RGBColor(56, 142, 142)
-    SIENNA: RGBColor = RGBColor(160, 82, 45)
-    SIENNA1: RGBColor = RGBColor(255, 130, 71)
-    SIENNA2: RGBColor = RGBColor(238, 121, 66)
-    SIENNA3: RGBColor = RGBColor(205, 104, 57)
-    SIENNA4: RGBColor = RGBColor(139, 71, 38)
-    SILVER: RGBColor = RGBColor(192, 192, 192)
-    SKYBLUE: RGBColor = RGBColor(135, 206, 235)
-    SKYBLUE1: RGBColor = RGBColor(135, 206, 255)
-    SKYBLUE2: RGBColor = RGBColor(126, 192, 238)
-    SKYBLUE3: RGBColor = RGBColor(108, 166, 205)
-    SKYBLUE4: RGBColor = RGBColor(74, 112, 139)
-    SLATEBLUE: RGBColor = RGBColor(106, 90, 205)
-    SLATEBLUE1: RGBColor = RGBColor(131, 111, 255)
-    SLATEBLUE2: RGBColor = RGBColor(122, 103, 238)
-    SLATEBLUE3: RGBColor = RGBColor(105, 89, 205)
-    SLATEBLUE4: RGBColor = RGBColor(71, 60, 139)
-    SLATEGRAY: RGBColor = RGBColor(112, 128, 144)
-    SLATEGRAY1: RGBColor = RGBColor(198, 226, 255)
-    SLATEGRAY2: RGBColor = RGBColor(185, 211, 238)
-    SLATEGRAY3: RGBColor = RGBColor(159, 182, 205)
-    SLATEGRAY4: RGBColor = RGBColor(108, 123, 139)
-    SNOW1: RGBColor = RGBColor(255, 250, 250)
-    SNOW2: RGBColor = RGBColor(238, 233, 233)
-    SNOW3: RGBColor = RGBColor(205, 201, 201)
-    SNOW4: RGBColor = RGBColor(139, 137, 137)
-    SPRINGGREEN: RGBColor = RGBColor(0, 255, 127)
-    SPRINGGREEN1: RGBColor = RGBColor(0, 238, 118)
-    SPRINGGREEN2: RGBColor = RGBColor(0, 205, 102)
-    SPRINGGREEN3: RGBColor = RGBColor(0, 139, 69)
-    STEELBLUE: RGBColor = RGBColor(70, 130, 180)
-    STEELBLUE1: RGBColor = RGBColor(99, 184, 255)
-    STEELBLUE2: RGBColor = RGBColor(92, 172, 238)
-    STEELBLUE3: RGBColor = RGBColor(79, 148, 205)
-    STEELBLUE4: RGBColor = RGBColor(54, 100, 139)
-    TAN: RGBColor = RGBColor(210, 180, 140)
-    TAN1: RGBColor = RGBColor(255, 165, 79)
-    TAN2: RGBColor = RGBColor(238, 154, 73)
-    TAN3: RGBColor = RGBColor(205, 133, 63)
-    TAN4: RGBColor = RGBColor(139, 90, 43)
-    TEAL: RGBColor = RGBColor(0, 128, 128)
-    THISTLE: RGBColor = RGBColor(216, 191, 216)
-    THISTLE1: RGBColor = RGBColor(255, 225, 255)
-    THISTLE2: RGBColor = RGBColor(238, 210, 238)
-    THISTLE3: RGBColor = RGBColor(205, 181, 205)
-    THISTLE4: RGBColor = RGBColor(139, 123, 139)
-    TOMATO1: RGBColor = RGBColor(255, 99, 71)
-    TOMATO2: RGBColor = RGBColor(238, 92, 66)
-    TOMATO3: RGBColor = RGBColor(205, 79, 57)
-    TOMATO4: RGBColor = RGBColor(139, 54, 38)
-    TURQUOISE: RGBColor = RGBColor(64, 224, 208)
-    TURQUOISE1: RGBColor = RGBColor(0, 245, 255)
-    TURQUOISE2: RGBColor = RGBColor(0, 229, 238)
-    TURQUOISE3: RGBColor = RGBColor(0, 197, 205)
-    TURQUOISE4: RGBColor = RGBColor(0, 134, 139)
-    TURQUOISEBLUE: RGBColor = RGBColor(0, 199, 140)
-    VIOLET: RGBColor = RGBColor(238, 130, 238)
-    VIOLETRED: RGBColor = RGBColor(208, 32, 144)
-    VIOLETRED1: RGBColor = RGBColor(255, 62, 150)
-    VIOLETRED2: RGBColor = RGBColor(238, 58, 140)
-    VIOLETRED3: RGBColor = RGBColor(205, 50, 120)
-    VIOLETRED4: RGBColor = RGBColor(139, 34, 82)
-    WARMGREY: RGBColor = RGBColor(128, 128, 105)
-    WHEAT: RGBColor = RGBColor(245, 222, 179)
-    WHEAT1: RGBColor = RGBColor(255, 231, 186)
-    WHEAT2: RGBColor = RGBColor(238, 216, 174)
-    WHEAT3: RGBColor = RGBColor(205, 186, 150)
-    WHEAT4: RGBColor = RGBColor(139, 126, 102)
-    WHITE: RGBColor = RGBColor(255, 255, 255)
-    WHITESMOKE: RGBColor = RGBColor(245, 245, 245)
-    YELLOW1: RGBColor = RGBColor(255, 255, 0)
-    YELLOW2: RGBColor = RGBColor(238, 238, 0)
-    YELLOW3: RGBColor = RGBColor(205, 205, 0)
-    YELLOW4: RGBColor = RGBColor(139, 139, 0)
+# JIT compiled kernels for very large color arrays (used if numba is installed)
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _jit_sat_add(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+        for i in prange(a.shape[0]):
+            for c in range(3):
+                value = np.int32(a[i, c]) + np.int32(b[i, c])
+                out[i, c] = 255 if value > 255 else value
+
+    @njit(parallel=True, cache=True)
+    def _jit_sat_sub(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+        for i in prange(a.shape[0]):
+            for c in range(3):
+                value = np.int32(a[i, c]) - np.int32(b[i, c])
+                out[i, c] = 0 if value < 0 else value
+
+else:
+    _jit_sat_add = None
+    _jit_sat_sub = None
+
+# Minimum array length before dispatching to the JIT kernels
+_JIT_THRESHOLD: int = 1 << 16
+
+
+class RGBColorArray:
+    """RGB color array class for bulk color operations
+
+    Wraps an (N, 3) uint8 NumPy array, so that arithmetic on
+    image-scale amounts of colors runs vectorized in C instead
+    of one Python operation per pixel.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        values = np.ascontiguousarray(values, dtype=np.uint8)
+        if not values.flags.writeable:
+            # Read-only sources (bytes buffers, the palette table) would break
+            # __setitem__ and the in-place operators, so copy them once here
+            values = values.copy()
+        self.values: np.ndarray = values
+
+    # CLASS METHODS
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Convert raw RGB bytes (3 bytes per color) to a color array"""
+        return cls(np.frombuffer(data, dtype=np.uint8).reshape(-1, 3))
+
+    # METHODS
+
+    def to_bytes(self) -> bytes:
+        """Get the raw RGB bytes (3 bytes per color)"""
+        return self.values.tobytes()
+
+    def list(self) -> list[RGBColor]:
+        """Create a list with a RGBColor for every entry"""
+        return [RGBColor._make(int(r), int(g), int(b)) for r, g, b in self.values]
+
+    def mix(self, other: Self) -> Self:
+        """Mix two RGB color arrays"""
+        # (a >> 1) + (b >> 1) + (a & b & 1) averages without leaving uint8,
+        # saving the int16 upcast and halving the memory traffic
+        mixed = self.values >> 1
+        mixed += other.values >> 1
+        mixed += self.values & other.values & 1
+        return RGBColorArray(mixed)
+
+    # OVERLOADS
+
+    def __add__(self, other: Self) -> Self:
+        if _jit_sat_add is not None and self.values.shape[0] >= _JIT_THRESHOLD:
+            added = np.empty_like(self.values)
+            _jit_sat_add(self.values, other.values, added)
+            return RGBColorArray(added)
+        # Saturating add without leaving uint8: a + min(b, 255 - a) can never wrap
+        added = self.values.copy()
+        added += np.minimum(other.values, 255 - added)
+        return RGBColorArray(added)
+
+    def __sub__(self, other: Self) -> Self:
+        if _jit_sat_sub is not None and self.values.shape[0] >= _JIT_THRESHOLD:
+            subtracted = np.empty_like(self.values)
+            _jit_sat_sub(self.values, other.values, subtracted)
+            return RGBColorArray(subtracted)
+        # Saturating subtract without leaving uint8: a - min(b, a) can never wrap
+        subtracted = self.values.copy()
+        subtracted -= np.minimum(other.values, subtracted)
+        return RGBColorArray(subtracted)
+
+    def __iadd__(self, other: Self) -> Self:
+        self.values += np.minimum(other.values, 255 - self.values)
+        return self
+
+    def __isub__(self, other: Self) -> Self:
+        self.values -= np.minimum(other.values, self.values)
+        return self
+
+    def __mul__(self, factor: Union[int, float]) -> Self:
+        return RGBColorArray(np.clip(np.rint(self.values * float(factor)), 0, 255))
+
+    def __truediv__(self, divisor: Union[int, float]) -> Self:
+        return RGBColorArray(np.clip(np.rint(self.values / divisor), 0, 255))
+
+    def __eq__(self, other: Self) -> bool:
+        return np.array_equal(self.values, other.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> RGBColor:
+        red, green, blue = self.values[index]
+        return RGBColor._make(int(red), int(green), int(blue))
+
+    def __setitem__(self, index: int, color: RGBColor) -> None:
+        self.values[index] = color
+
+    def __repr__(self) -> str:
+        return f"RGBArray[id={id(self)}, length={len(self.values)}]"
+
+
+# Palette color table (name, red, green, blue)
+_RAW: tuple[tuple[str, int, int, int], ...] = (
+    ("ALICEBLUE", 240, 248, 255),
+    ("ANTIQUEWHITE", 250, 235, 215),
+    ("ANTIQUEWHITE1", 255, 239, 219),
+    ("ANTIQUEWHITE2", 238, 223, 204),
+    ("ANTIQUEWHITE3", 205, 192, 176),
+    ("ANTIQUEWHITE4", 139, 131, 120),
+    ("AQUA", 0, 255, 255),
+    ("AQUAMARINE1", 127, 255, 212),
+    ("AQUAMARINE2", 118, 238, 198),
+    ("AQUAMARINE3", 102, 205, 170),
+    ("AQUAMARINE4", 69, 139, 116),
+    ("AZURE1", 240, 255, 255),
+    ("AZURE2", 224, 238, 238),
+    ("AZURE3", 193, 205, 205),
+    ("AZURE4", 131, 139, 139),
+    ("BANANA", 227, 207, 87),
+    ("BEIGE", 245, 245, 220),
+    ("BISQUE1", 255, 228, 196),
+    ("BISQUE2", 238, 213, 183),
+    ("BISQUE3", 205, 183, 158),
+    ("BISQUE4", 139, 125, 107),
+    ("BLACK", 0, 0, 0),
+    ("BLANCHEDALMOND", 255, 235, 205),
+    ("BLUE", 0, 0, 255),
+    ("BLUE2", 0, 0, 238),
+    ("BLUE3", 0, 0, 205),
+    ("BLUE4", 0, 0, 139),
+    ("BLUEVIOLET", 138, 43, 226),
+    ("BRICK", 156, 102, 31),
+    ("BROWN", 165, 42, 42),
+    ("BROWN1", 255, 64, 64),
+    ("BROWN2", 238, 59, 59),
+    ("BROWN3", 205, 51, 51),
+    ("BROWN4", 139, 35, 35),
+    ("BURLYWOOD", 222, 184, 135),
+    ("BURLYWOOD1", 255, 211, 155),
+    ("BURLYWOOD2", 238, 197, 145),
+    ("BURLYWOOD3", 205, 170, 125),
+    ("BURLYWOOD4", 139, 115, 85),
+    ("BURNTSIENNA", 138, 54, 15),
+    ("BURNTUMBER", 138, 51, 36),
+    ("CADETBLUE", 95, 158, 160),
+    ("CADETBLUE1", 152, 245, 255),
+    ("CADETBLUE2", 142, 229, 238),
+    ("CADETBLUE3", 122, 197, 205),
+    ("CADETBLUE4", 83, 134, 139),
+    ("CADMIUMORANGE", 255, 97, 3),
+    ("CADMIUMYELLOW", 255, 153, 18),
+    ("CARROT", 237, 145, 33),
+    ("CHARTREUSE1", 127, 255, 0),
+    ("CHARTREUSE2", 118, 238, 0),
+    ("CHARTREUSE3", 102, 205, 0),
+    ("CHARTREUSE4", 69, 139, 0),
+    ("CHOCOLATE", 210, 105, 30),
+    ("CHOCOLATE1", 255, 127, 36),
+    ("CHOCOLATE2", 238, 118, 33),
+    ("CHOCOLATE3", 205, 102, 29),
+    ("CHOCOLATE4", 139, 69, 19),
+    ("COBALT", 61, 89, 171),
+    ("COBALTGREEN", 61, 145, 64),
+    ("COLDGREY", 128, 138, 135),
+    ("CORAL", 255, 127, 80),
+    ("CORAL1", 255, 114, 86),
+    ("CORAL2", 238, 106, 80),
+    ("CORAL3", 205, 91, 69),
+    ("CORAL4", 139, 62, 47),
+    ("CORNFLOWERBLUE", 100, 149, 237),
+    ("CORNSILK1", 255, 248, 220),
+    ("CORNSILK2", 238, 232, 205),
+    ("CORNSILK3", 205, 200, 177),
+    ("CORNSILK4", 139, 136, 120),
+    ("CRIMSON", 220, 20, 60),
+    ("CYAN2", 0, 238, 238),
+    ("CYAN3", 0, 205, 205),
+    ("CYAN4", 0, 139, 139),
+    ("DARKGOLDENROD", 184, 134, 11),
+    ("DARKGOLDENROD1", 255, 185, 15),
+    ("DARKGOLDENROD2", 238, 173, 14),
+    ("DARKGOLDENROD3", 205, 149, 12),
+    ("DARKGOLDENROD4", 139, 101, 8),
+    ("DARKGRAY", 169, 169, 169),
+    ("DARKGREEN", 0, 100, 0),
+    ("DARKKHAKI", 189, 183, 107),
+    ("DARKOLIVEGREEN", 85, 107, 47),
+    ("DARKOLIVEGREEN1", 202, 255, 112),
+    ("DARKOLIVEGREEN2", 188, 238, 104),
+    ("DARKOLIVEGREEN3", 162, 205, 90),
+    ("DARKOLIVEGREEN4", 110, 139, 61),
+    ("DARKORANGE", 255, 140, 0),
+    ("DARKORANGE1", 255, 127, 0),
+    ("DARKORANGE2", 238, 118, 0),
+    ("DARKORANGE3", 205, 102, 0),
+    ("DARKORANGE4", 139, 69, 0),
+    ("DARKORCHID", 153, 50, 204),
+    ("DARKORCHID1", 191, 62, 255),
+    ("DARKORCHID2", 178, 58, 238),
+    ("DARKORCHID3", 154, 50, 205),
+    ("DARKORCHID4", 104, 34, 139),
+    ("DARKSALMON", 233, 150, 122),
+    ("DARKSEAGREEN", 143, 188, 143),
+    ("DARKSEAGREEN1", 193, 255, 193),
+    ("DARKSEAGREEN2", 180, 238, 180),
+    ("DARKSEAGREEN3", 155, 205, 155),
+    ("DARKSEAGREEN4", 105, 139, 105),
+    ("DARKSLATEBLUE", 72, 61, 139),
+    ("DARKSLATEGRAY", 47, 79, 79),
+    ("DARKSLATEGRAY1", 151, 255, 255),
+    ("DARKSLATEGRAY2", 141, 238, 238),
+    ("DARKSLATEGRAY3", 121, 205, 205),
+    ("DARKSLATEGRAY4", 82, 139, 139),
+    ("DARKTURQUOISE", 0, 206, 209),
+    ("DARKVIOLET", 148, 0, 211),
+    ("DEEPPINK1", 255, 20, 147),
+    ("DEEPPINK2", 238, 18, 137),
+    ("DEEPPINK3", 205, 16, 118),
+    ("DEEPPINK4", 139, 10, 80),
+    ("DEEPSKYBLUE1", 0, 191, 255),
+    ("DEEPSKYBLUE2", 0, 178, 238),
+    ("DEEPSKYBLUE3", 0, 154, 205),
+    ("DEEPSKYBLUE4", 0, 104, 139),
+    ("DIMGRAY", 105, 105, 105),
+    ("DODGERBLUE1", 30, 144, 255),
+    ("DODGERBLUE2", 28, 134, 238),
+    ("DODGERBLUE3", 24, 116, 205),
+    ("DODGERBLUE4", 16, 78, 139),
+    ("EGGSHELL", 252, 230, 201),
+    ("EMERALDGREEN", 0, 201, 87),
+    ("FIREBRICK", 178, 34, 34),
+    ("FIREBRICK1", 255, 48, 48),
+    ("FIREBRICK2", 238, 44, 44),
+    ("FIREBRICK3", 205, 38, 38),
+    ("FIREBRICK4", 139, 26, 26),
+    ("FLESH", 255, 125, 64),
+    ("FLORALWHITE", 255, 250, 240),
+    ("FORESTGREEN", 34, 139, 34),
+    ("GAINSBORO", 220, 220, 220),
+    ("GHOSTWHITE", 248, 248, 255),
+    ("GOLD1", 255, 215, 0),
+    ("GOLD2", 238, 201, 0),
+    ("GOLD3", 205, 173, 0),
+    ("GOLD4", 139, 117, 0),
+    ("GOLDENROD", 218, 165, 32),
+    ("GOLDENROD1", 255, 193, 37),
+    ("GOLDENROD2", 238, 180, 34),
+    ("GOLDENROD3", 205, 155, 29),
+    ("GOLDENROD4", 139, 105, 20),
+    ("GRAY", 128, 128, 128),
+    ("GRAY1", 3, 3, 3),
+    ("GRAY10", 26, 26, 26),
+    ("GRAY11", 28, 28, 28),
+    ("GRAY12", 31, 31, 31),
+    ("GRAY13", 33, 33, 33),
+    ("GRAY14", 36, 36, 36),
+    ("GRAY15", 38, 38, 38),
+    ("GRAY16", 41, 41, 41),
+    ("GRAY17", 43, 43, 43),
+    ("GRAY18", 46, 46, 46),
+    ("GRAY19", 48, 48, 48),
+    ("GRAY2", 5, 5, 5),
+    ("GRAY20", 51, 51, 51),
+    ("GRAY21", 54, 54, 54),
+    ("GRAY22", 56, 56, 56),
+    ("GRAY23", 59, 59, 59),
+    ("GRAY24", 61, 61, 61),
+    ("GRAY25", 64, 64, 64),
+    ("GRAY26", 66, 66, 66),
+    ("GRAY27", 69, 69, 69),
+    ("GRAY28", 71, 71, 71),
+    ("GRAY29", 74, 74, 74),
+    ("GRAY3", 8, 8, 8),
+    ("GRAY30", 77, 77, 77),
+    ("GRAY31", 79, 79, 79),
+    ("GRAY32", 82, 82, 82),
+    ("GRAY33", 84, 84, 84),
+    ("GRAY34", 87, 87, 87),
+    ("GRAY35", 89, 89, 89),
+    ("GRAY36", 92, 92, 92),
+    ("GRAY37", 94, 94, 94),
+    ("GRAY38", 97, 97, 97),
+    ("GRAY39", 99, 99, 99),
+    ("GRAY4", 10, 10, 10),
+    ("GRAY40", 102, 102, 102),
+    ("GRAY42", 107, 107, 107),
+    ("GRAY43", 110, 110, 110),
+    ("GRAY44", 112, 112, 112),
+    ("GRAY45", 115, 115, 115),
+    ("GRAY46", 117, 117, 117),
+    ("GRAY47", 120, 120, 120),
+    ("GRAY48", 122, 122, 122),
+    ("GRAY49", 125, 125, 125),
+    ("GRAY5", 13, 13, 13),
+    ("GRAY50", 127, 127, 127),
+    ("GRAY51", 130, 130, 130),
+    ("GRAY52", 133, 133, 133),
+    ("GRAY53", 135, 135, 135),
+    ("GRAY54", 138, 138, 138),
+    ("GRAY55", 140, 140, 140),
+    ("GRAY56", 143, 143, 143),
+    ("GRAY57", 145, 145, 145),
+    ("GRAY58", 148, 148, 148),
+    ("GRAY59", 150, 150, 150),
+    ("GRAY6", 15, 15, 15),
+    ("GRAY60", 153, 153, 153),
+    ("GRAY61", 156, 156, 156),
+    ("GRAY62", 158, 158, 158),
+    ("GRAY63", 161, 161, 161),
+    ("GRAY64", 163, 163, 163),
+    ("GRAY65", 166, 166, 166),
+    ("GRAY66", 168, 168, 168),
+    ("GRAY67", 171, 171, 171),
+    ("GRAY68", 173, 173, 173),
+    ("GRAY69", 176, 176, 176),
+    ("GRAY7", 18, 18, 18),
+    ("GRAY70", 179, 179, 179),
+    ("GRAY71", 181, 181, 181),
+    ("GRAY72", 184, 184, 184),
+    ("GRAY73", 186, 186, 186),
+    ("GRAY74", 189, 189, 189),
+    ("GRAY75", 191, 191, 191),
+    ("GRAY76", 194, 194, 194),
+    ("GRAY77", 196, 196, 196),
+    ("GRAY78", 199, 199, 199),
+    ("GRAY79", 201, 201, 201),
+    ("GRAY8", 20, 20, 20),
+    ("GRAY80", 204, 204, 204),
+    ("GRAY81", 207, 207, 207),
+    ("GRAY82", 209, 209, 209),
+    ("GRAY83", 212, 212, 212),
+    ("GRAY84", 214, 214, 214),
+    ("GRAY85", 217, 217, 217),
+    ("GRAY86", 219, 219, 219),
+    ("GRAY87", 222, 222, 222),
+    ("GRAY88", 224, 224, 224),
+    ("GRAY89", 227, 227, 227),
+    ("GRAY9", 23, 23, 23),
+    ("GRAY90", 229, 229, 229),
+    ("GRAY91", 232, 232, 232),
+    ("GRAY92", 235, 235, 235),
+    ("GRAY93", 237, 237, 237),
+    ("GRAY94", 240, 240, 240),
+    ("GRAY95", 242, 242, 242),
+    ("GRAY97", 247, 247, 247),
+    ("GRAY98", 250, 250, 250),
+    ("GRAY99", 252, 252, 252),
+    ("GREEN", 0, 128, 0),
+    ("GREEN1", 0, 255, 0),
+    ("GREEN2", 0, 238, 0),
+    ("GREEN3", 0, 205, 0),
+    ("GREEN4", 0, 139, 0),
+    ("GREENYELLOW", 173, 255, 47),
+    ("HONEYDEW1", 240, 255, 240),
+    ("HONEYDEW2", 224, 238, 224),
+    ("HONEYDEW3", 193, 205, 193),
+    ("HONEYDEW4", 131, 139, 131),
+    ("HOTPINK", 255, 105, 180),
+    ("HOTPINK1", 255, 110, 180),
+    ("HOTPINK2", 238, 106, 167),
+    ("HOTPINK3", 205, 96, 144),
+    ("HOTPINK4", 139, 58, 98),
+    ("INDIANRED", 205, 92, 92),
+    ("INDIANRED1", 255, 106, 106),
+    ("INDIANRED2", 238, 99, 99),
+    ("INDIANRED3", 205, 85, 85),
+    ("INDIANRED4", 139, 58, 58),
+    ("INDIGO", 75, 0, 130),
+    ("IVORY1", 255, 255, 240),
+    ("IVORY2", 238, 238, 224),
+    ("IVORY3", 205, 205, 193),
+    ("IVORY4", 139, 139, 131),
+    ("IVORYBLACK", 41, 36, 33),
+    ("KHAKI", 240, 230, 140),
+    ("KHAKI1", 255, 246, 143),
+    ("KHAKI2", 238, 230, 133),
+    ("KHAKI3", 205, 198, 115),
+    ("KHAKI4", 139, 134, 78),
+    ("LAVENDER", 230, 230, 250),
+    ("LAVENDERBLUSH1", 255, 240, 245),
+    ("LAVENDERBLUSH2", 238, 224, 229),
+    ("LAVENDERBLUSH3", 205, 193, 197),
+    ("LAVENDERBLUSH4", 139, 131, 134),
+    ("LAWNGREEN", 124, 252, 0),
+    ("LEMONCHIFFON1", 255, 250, 205),
+    ("LEMONCHIFFON2", 238, 233, 191),
+    ("LEMONCHIFFON3", 205, 201, 165),
+    ("LEMONCHIFFON4", 139, 137, 112),
+    ("LIGHTBLUE", 173, 216, 230),
+    ("LIGHTBLUE1", 191, 239, 255),
+    ("LIGHTBLUE2", 178, 223, 238),
+    ("LIGHTBLUE3", 154, 192, 205),
+    ("LIGHTBLUE4", 104, 131, 139),
+    ("LIGHTCORAL", 240, 128, 128),
+    ("LIGHTCYAN1", 224, 255, 255),
+    ("LIGHTCYAN2", 209, 238, 238),
+    ("LIGHTCYAN3", 180, 205, 205),
+    ("LIGHTCYAN4", 122, 139, 139),
+    ("LIGHTGOLDENROD1", 255, 236, 139),
+    ("LIGHTGOLDENROD2", 238, 220, 130),
+    ("LIGHTGOLDENROD3", 205, 190, 112),
+    ("LIGHTGOLDENROD4", 139, 129, 76),
+    ("LIGHTGOLDENRODYELLOW", 250, 250, 210),
+    ("LIGHTGREY", 211, 211, 211),
+    ("LIGHTPINK", 255, 182, 193),
+    ("LIGHTPINK1", 255, 174, 185),
+    ("LIGHTPINK2", 238, 162, 173),
+    ("LIGHTPINK3", 205, 140, 149),
+    ("LIGHTPINK4", 139, 95, 101),
+    ("LIGHTSALMON1", 255, 160, 122),
+    ("LIGHTSALMON2", 238, 149, 114),
+    ("LIGHTSALMON3", 205, 129, 98),
+    ("LIGHTSALMON4", 139, 87, 66),
+    ("LIGHTSEAGREEN", 32, 178, 170),
+    ("LIGHTSKYBLUE", 135, 206, 250),
+    ("LIGHTSKYBLUE1", 176, 226, 255),
+    ("LIGHTSKYBLUE2", 164, 211, 238),
+    ("LIGHTSKYBLUE3", 141, 182, 205),
+    ("LIGHTSKYBLUE4", 96, 123, 139),
+    ("LIGHTSLATEBLUE", 132, 112, 255),
+    ("LIGHTSLATEGRAY", 119, 136, 153),
+    ("LIGHTSTEELBLUE", 176, 196, 222),
+    ("LIGHTSTEELBLUE1", 202, 225, 255),
+    ("LIGHTSTEELBLUE2", 188, 210, 238),
+    ("LIGHTSTEELBLUE3", 162, 181, 205),
+    ("LIGHTSTEELBLUE4", 110, 123, 139),
+    ("LIGHTYELLOW1", 255, 255, 224),
+    ("LIGHTYELLOW2", 238, 238, 209),
+    ("LIGHTYELLOW3", 205, 205, 180),
+    ("LIGHTYELLOW4", 139, 139, 122),
+    ("LIMEGREEN", 50, 205, 50),
+    ("LINEN", 250, 240, 230),
+    ("MAGENTA", 255, 0, 255),
+    ("MAGENTA2", 238, 0, 238),
+    ("MAGENTA3", 205, 0, 205),
+    ("MAGENTA4", 139, 0, 139),
+    ("MANGANESEBLUE", 3, 168, 158),
+    ("MAROON", 128, 0, 0),
+    ("MAROON1", 255, 52, 179),
+    ("MAROON2", 238, 48, 167),
+    ("MAROON3", 205, 41, 144),
+    ("MAROON4", 139, 28, 98),
+    ("MEDIUMORCHID", 186, 85, 211),
+    ("MEDIUMORCHID1", 224, 102, 255),
+    ("MEDIUMORCHID2", 209, 95, 238),
+    ("MEDIUMORCHID3", 180, 82, 205),
+    ("MEDIUMORCHID4", 122, 55, 139),
+    ("MEDIUMPURPLE", 147, 112, 219),
+    ("MEDIUMPURPLE1", 171, 130, 255),
+    ("MEDIUMPURPLE2", 159, 121, 238),
+    ("MEDIUMPURPLE3", 137, 104, 205),
+    ("MEDIUMPURPLE4", 93, 71, 139),
+    ("MEDIUMSEAGREEN", 60, 179, 113),
+    ("MEDIUMSLATEBLUE", 123, 104, 238),
+    ("MEDIUMSPRINGGREEN", 0, 250, 154),
+    ("MEDIUMTURQUOISE", 72, 209, 204),
+    ("MEDIUMVIOLETRED", 199, 21, 133),
+    ("MELON", 227, 168, 105),
+    ("MIDNIGHTBLUE", 25, 25, 112),
+    ("MINT", 189, 252, 201),
+    ("MINTCREAM", 245, 255, 250),
+    ("MISTYROSE1", 255, 228, 225),
+    ("MISTYROSE2", 238, 213, 210),
+    ("MISTYROSE3", 205, 183, 181),
+    ("MISTYROSE4", 139, 125, 123),
+    ("MOCCASIN", 255, 228, 181),
+    ("NAVAJOWHITE1", 255, 222, 173),
+    ("NAVAJOWHITE2", 238, 207, 161),
+    ("NAVAJOWHITE3", 205, 179, 139),
+    ("NAVAJOWHITE4", 139, 121, 94),
+    ("NAVY", 0, 0, 128),
+    ("OLDLACE", 253, 245, 230),
+    ("OLIVE", 128, 128, 0),
+    ("OLIVEDRAB", 107, 142, 35),
+    ("OLIVEDRAB1", 192, 255, 62),
+    ("OLIVEDRAB2", 179, 238, 58),
+    ("OLIVEDRAB3", 154, 205, 50),
+    ("OLIVEDRAB4", 105, 139, 34),
+    ("ORANGE", 255, 128, 0),
+    ("ORANGE1", 255, 165, 0),
+    ("ORANGE2", 238, 154, 0),
+    ("ORANGE3", 205, 133, 0),
+    ("ORANGE4", 139, 90, 0),
+    ("ORANGERED1", 255, 69, 0),
+    ("ORANGERED2", 238, 64, 0),
+    ("ORANGERED3", 205, 55, 0),
+    ("ORANGERED4", 139, 37, 0),
+    ("ORCHID", 218, 112, 214),
+    ("ORCHID1", 255, 131, 250),
+    ("ORCHID2", 238, 122, 233),
+    ("ORCHID3", 205, 105, 201),
+    ("ORCHID4", 139, 71, 137),
+    ("PALEGOLDENROD", 238, 232, 170),
+    ("PALEGREEN", 152, 251, 152),
+    ("PALEGREEN1", 154, 255, 154),
+    ("PALEGREEN2", 144, 238, 144),
+    ("PALEGREEN3", 124, 205, 124),
+    ("PALEGREEN4", 84, 139, 84),
+    ("PALETURQUOISE1", 187, 255, 255),
+    ("PALETURQUOISE2", 174, 238, 238),
+    ("PALETURQUOISE3", 150, 205, 205),
+    ("PALETURQUOISE4", 102, 139, 139),
+    ("PALEVIOLETRED", 219, 112, 147),
+    ("PALEVIOLETRED1", 255, 130, 171),
+    ("PALEVIOLETRED2", 238, 121, 159),
+    ("PALEVIOLETRED3", 205, 104, 137),
+    ("PALEVIOLETRED4", 139, 71, 93),
+    ("PAPAYAWHIP", 255, 239, 213),
+    ("PEACHPUFF1", 255, 218, 185),
+    ("PEACHPUFF2", 238, 203, 173),
+    ("PEACHPUFF3", 205, 175, 149),
+    ("PEACHPUFF4", 139, 119, 101),
+    ("PEACOCK", 51, 161, 201),
+    ("PINK", 255, 192, 203),
+    ("PINK1", 255, 181, 197),
+    ("PINK2", 238, 169, 184),
+    ("PINK3", 205, 145, 158),
+    ("PINK4", 139, 99, 108),
+    ("PLUM", 221, 160, 221),
+    ("PLUM1", 255, 187, 255),
+    ("PLUM2", 238, 174, 238),
+    ("PLUM3", 205, 150, 205),
+    ("PLUM4", 139, 102, 139),
+    ("POWDERBLUE", 176, 224, 230),
+    ("PURPLE", 128, 0, 128),
+    ("PURPLE1", 155, 48, 255),
+    ("PURPLE2", 145, 44, 238),
+    ("PURPLE3", 125, 38, 205),
+    ("PURPLE4", 85, 26, 139),
+    ("RASPBERRY", 135, 38, 87),
+    ("RAWSIENNA", 199, 97, 20),
+    ("RED1", 255, 0, 0),
+    ("RED2", 238, 0, 0),
+    ("RED3", 205, 0, 0),
+    ("RED4", 139, 0, 0),
+    ("ROSYBROWN", 188, 143, 143),
+    ("ROSYBROWN1", 255, 193, 193),
+    ("ROSYBROWN2", 238, 180, 180),
+    ("ROSYBROWN3", 205, 155, 155),
+    ("ROSYBROWN4", 139, 105, 105),
+    ("ROYALBLUE", 65, 105, 225),
+    ("ROYALBLUE1", 72, 118, 255),
+    ("ROYALBLUE2", 67, 110, 238),
+    ("ROYALBLUE3", 58, 95, 205),
+    ("ROYALBLUE4", 39, 64, 139),
+    ("SALMON", 250, 128, 114),
+    ("SALMON1", 255, 140, 105),
+    ("SALMON2", 238, 130, 98),
+    ("SALMON3", 205, 112, 84),
+    ("SALMON4", 139, 76, 57),
+    ("SANDYBROWN", 244, 164, 96),
+    ("SAPGREEN", 48, 128, 20),
+    ("SEAGREEN1", 84, 255, 159),
+    ("SEAGREEN2", 78, 238, 148),
+    ("SEAGREEN3", 67, 205, 128),
+    ("SEAGREEN4", 46, 139, 87),
+    ("SEASHELL1", 255, 245, 238),
+    ("SEASHELL2", 238, 229, 222),
+    ("SEASHELL3", 205, 197, 191),
+    ("SEASHELL4", 139, 134, 130),
+    ("SEPIA", 94, 38, 18),
+    ("SGIBEET", 142, 56, 142),
+    ("SGIBRIGHTGRAY", 197, 193, 170),
+    ("SGICHARTREUSE", 113, 198, 113),
+    ("SGIDARKGRAY", 85, 85, 85),
+    ("SGIGRAY12", 30, 30, 30),
+    ("SGIGRAY16", 40, 40, 40),
+    ("SGIGRAY32", 81, 81, 81),
+    ("SGIGRAY36", 91, 91, 91),
+    ("SGIGRAY52", 132, 132, 132),
+    ("SGIGRAY56", 142, 142, 142),
+    ("SGIGRAY72", 183, 183, 183),
+    ("SGIGRAY76", 193, 193, 193),
+    ("SGIGRAY92", 234, 234, 234),
+    ("SGIGRAY96", 244, 244, 244),
+    ("SGILIGHTBLUE", 125, 158, 192),
+    ("SGILIGHTGRAY", 170, 170, 170),
+    ("SGIOLIVEDRAB", 142, 142, 56),
+    ("SGISALMON", 198, 113, 113),
+    ("SGISLATEBLUE", 113, 113, 198),
+    ("SGITEAL", 56, 142, 142),
+    ("SIENNA", 160, 82, 45),
+    ("SIENNA1", 255, 130, 71),
+    ("SIENNA2", 238, 121, 66),
+    ("SIENNA3", 205, 104, 57),
+    ("SIENNA4", 139, 71, 38),
+    ("SILVER", 192, 192, 192),
+    ("SKYBLUE", 135, 206, 235),
+    ("SKYBLUE1", 135, 206, 255),
+    ("SKYBLUE2", 126, 192, 238),
+    ("SKYBLUE3", 108, 166, 205),
+    ("SKYBLUE4", 74, 112, 139),
+    ("SLATEBLUE", 106, 90, 205),
+    ("SLATEBLUE1", 131, 111, 255),
+    ("SLATEBLUE2", 122, 103, 238),
+    ("SLATEBLUE3", 105, 89, 205),
+    ("SLATEBLUE4", 71, 60, 139),
+    ("SLATEGRAY", 112, 128, 144),
+    ("SLATEGRAY1", 198, 226, 255),
+    ("SLATEGRAY2", 185, 211, 238),
+    ("SLATEGRAY3", 159, 182, 205),
+    ("SLATEGRAY4", 108, 123, 139),
+    ("SNOW1", 255, 250, 250),
+    ("SNOW2", 238, 233, 233),
+    ("SNOW3", 205, 201, 201),
+    ("SNOW4", 139, 137, 137),
+    ("SPRINGGREEN", 0, 255, 127),
+    ("SPRINGGREEN1", 0, 238, 118),
+    ("SPRINGGREEN2", 0, 205, 102),
+    ("SPRINGGREEN3", 0, 139, 69),
+    ("STEELBLUE", 70, 130, 180),
+    ("STEELBLUE1", 99, 184, 255),
+    ("STEELBLUE2", 92, 172, 238),
+    ("STEELBLUE3", 79, 148, 205),
+    ("STEELBLUE4", 54, 100, 139),
+    ("TAN", 210, 180, 140),
+    ("TAN1", 255, 165, 79),
+    ("TAN2", 238, 154, 73),
+    ("TAN3", 205, 133, 63),
+    ("TAN4", 139, 90, 43),
+    ("TEAL", 0, 128, 128),
+    ("THISTLE", 216, 191, 216),
+    ("THISTLE1", 255, 225, 255),
+    ("THISTLE2", 238, 210, 238),
+    ("THISTLE3", 205, 181, 205),
+    ("THISTLE4", 139, 123, 139),
+    ("TOMATO1", 255, 99, 71),
+    ("TOMATO2", 238, 92, 66),
+    ("TOMATO3", 205, 79, 57),
+    ("TOMATO4", 139, 54, 38),
+    ("TURQUOISE", 64, 224, 208),
+    ("TURQUOISE1", 0, 245, 255),
+    ("TURQUOISE2", 0, 229, 238),
+    ("TURQUOISE3", 0, 197, 205),
+    ("TURQUOISE4", 0, 134, 139),
+    ("TURQUOISEBLUE", 0, 199, 140),
+    ("VIOLET", 238, 130, 238),
+    ("VIOLETRED", 208, 32, 144),
+    ("VIOLETRED1", 255, 62, 150),
+    ("VIOLETRED2", 238, 58, 140),
+    ("VIOLETRED3", 205, 50, 120),
+    ("VIOLETRED4", 139, 34, 82),
+    ("WARMGREY", 128, 128, 105),
+    ("WHEAT", 245, 222, 179),
+    ("WHEAT1", 255, 231, 186),
+    ("WHEAT2", 238, 216, 174),
+    ("WHEAT3", 205, 186, 150),
+    ("WHEAT4", 139, 126, 102),
+    ("WHITE", 255, 255, 255),
+    ("WHITESMOKE", 245, 245, 245),
+    ("YELLOW1", 255, 255, 0),
+    ("YELLOW2", 238, 238, 0),
+    ("YELLOW3", 205, 205, 0),
+    ("YELLOW4", 139, 139, 0),
+)
+
+
+class RGB:
+    """RGB color library
+
+    Access colors as plain class attributes (e.g. RGB.WHITE)
+
+    Every color is a RGBColor and therefore a real 3-tuple, so pygame's
+    draw, fill and blit functions consume the constants directly through
+    their C-level tuple parsing with no unpacking or conversion cost
+    """
+
+
+# Generate the palette attributes (plain attribute loads, no enum metaclass machinery)
+_PALETTE: dict[str, RGBColor] = {name: RGBColor(red, green, blue) for name, red, green, blue in _RAW}
+for _name, _color in _PALETTE.items():
+    setattr(RGB, _name, _color)
+del _name, _color
+
+
+
+# Structure-of-arrays view of the palette (one contiguous array per channel,
+# so color searches run as vectorized NumPy expressions over 3 bytes per color)
+_PALETTE_NAMES: tuple[str, ...] = tuple(_PALETTE)
+_PAL_R: np.ndarray = np.array([value[0] for value in _PALETTE.values()], dtype=np.int32)
+_PAL_G: np.ndarray = np.array([value[1] for value in _PALETTE.values()], dtype=np.int32)
+_PAL_B: np.ndarray = np.array([value[2] for value in _PALETTE.values()], dtype=np.int32)
+
+# Packed 0xRRGGBB palette view (one uint32 lane per color for batched lookups)
+_PAL_PACKED: np.ndarray = np.array([value.packed for value in _PALETTE.values()], dtype=np.uint32)
+
+# Full palette as one contiguous read-only (N, 3) uint8 table with a name to row mapping
+_PALETTE_ARRAY: np.ndarray = np.array(list(_PALETTE.values()), dtype=np.uint8)
+_PALETTE_ARRAY.setflags(write=False)
+_PALETTE_INDEX: dict[str, int] = {name: index for index, name in enumerate(_PALETTE_NAMES)}
+
+
+def palette_table() -> np.ndarray:
+    """Get the whole palette as a read-only (N, 3) uint8 array"""
+    return _PALETTE_ARRAY
+
+
+def palette_index(name: str) -> int:
+    """Get the row index of a named color in the palette table"""
+    return _PALETTE_INDEX[name]
+
+
+def nearest_color(color: RGBColor) -> RGBColor:
+    """Find the named palette color closest to a RGB color"""
+    distance = (_PAL_R - color[0]) ** 2 + (_PAL_G - color[1]) ** 2 + (_PAL_B - color[2]) ** 2
+    return getattr(RGB, _PALETTE_NAMES[int(distance.argmin())])
+
+
+# Optional GPU backend for massive palette searches (used if cupy is installed)
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+# Palette channels on the GPU (uploaded once on first use)
+_PAL_GPU = None
+
+# Block size for the CPU palette search (keeps the distance matrix cache-resident)
+_SEARCH_BLOCK: int = 1 << 15
+
+
+def nearest_colors(values: np.ndarray) -> RGBColorArray:
+    """Map an (N, 3) array of RGB values to the closest named palette colors
+
+    Runs as one GPU kernel per block if cupy is installed,
+    otherwise as blocked vectorized NumPy.
+    """
+    arr = np.ascontiguousarray(values, dtype=np.int32).reshape(-1, 3)
+    if cp is not None:
+        global _PAL_GPU
+        if _PAL_GPU is None:
+            _PAL_GPU = (cp.asarray(_PAL_R), cp.asarray(_PAL_G), cp.asarray(_PAL_B))
+        pal_r, pal_g, pal_b = _PAL_GPU
+        colors = cp.asarray(arr)
+        distance = ((colors[:, 0:1] - pal_r) ** 2 +
+                    (colors[:, 1:2] - pal_g) ** 2 +
+                    (colors[:, 2:3] - pal_b) ** 2)
+        index = cp.asnumpy(distance.argmin(axis=1))
+    else:
+        index = np.empty(arr.shape[0], dtype=np.intp)
+        for start in range(0, arr.shape[0], _SEARCH_BLOCK):
+            block = arr[start:start + _SEARCH_BLOCK]
+            distance = ((block[:, 0:1] - _PAL_R) ** 2 +
+                        (block[:, 1:2] - _PAL_G) ** 2 +
+                        (block[:, 2:3] - _PAL_B) ** 2)
+            index[start:start + _SEARCH_BLOCK] = distance.argmin(axis=1)
+    return RGBColorArray(_PALETTE_ARRAY.take(index, axis=0))
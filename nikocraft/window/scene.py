@@ -1,7 +1,8 @@
 # Standard modules
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import logging
+if TYPE_CHECKING:
+    import logging
 
 # External modules
 import pygame as pg
@@ -12,44 +13,124 @@ if TYPE_CHECKING:
 from .vector2d import Vec
 
 
+# Shared default for scenes constructed without arguments - never mutate,
+# scenes that need their own arguments must be given their own dict
+_EMPTY_ARGS: dict = {}
+
+
 class Scene:
-    """Scene class"""
+    """Scene class
+
+    Scene attributes live in fixed slots, so every access is a direct
+    C-level load instead of a dict probe - subclasses can declare their
+    own __slots__ for the same effect or simply add attributes as usual
+    """
+
+    __slots__ = ("__weakref__", "window", "args", "screen", "screen_cache", "_screen",
+                 "logger", "_screen_ref", "width", "height", "dimension", "dimension_tuple", "dt",
+                 "dirty", "dirty_rects", "render_interval", "render_pending", "_frame_counter",
+                 "_event_hook", "_early_update_hook", "_update_hook", "_late_update_hook")
 
     def __init__(self, window: Window, args: dict = None) -> None:
 
         # Window and arguments
         self.window: Window = window
-        self.args: dict = {} if args is None else args
+        self.args: dict = _EMPTY_ARGS if args is None else args
 
         # Screen cache system
         self.screen_cache: bool = False
         self._screen: pg.Surface | None = None
+        self.dirty: bool = True
+        self.dirty_rects: list[pg.Rect] = []
+
+        # Render skipping (render every n-th frame, render_pending forces the next frame)
+        self.render_interval: int = 1
+        self.render_pending: bool = True
+        self._frame_counter: int = 0
+
+        # Cached window state (plain attributes, refreshed by the window on screen changes)
+        self.logger: logging.Logger = window.app.logger
+        self._screen_ref: pg.Surface = window.screen
+        self.screen: pg.Surface = window.screen
+        self.width, self.height = self._screen_ref.get_size()
+        self.dimension: Vec = Vec(self.width, self.height)
+        self.dimension_tuple: tuple[int, int] = (self.width, self.height)
+
+        # Delta time (written by the window once per frame)
+        self.dt: float = window.clock.delta_time
+
+        # Bound per frame hooks, or None where a subclass keeps the empty default
+        # (lets the window loop skip calls into empty bodies)
+        cls = type(self)
+        self._event_hook = self.event if cls.event is not Scene.event else None
+        self._early_update_hook = self.early_update if cls.early_update is not Scene.early_update else None
+        self._update_hook = self.update if cls.update is not Scene.update else None
+        self._late_update_hook = self.late_update if cls.late_update is not Scene.late_update else None
+
+    # METHODS
+
+    def enable_screen_cache(self, surface: pg.Surface) -> None:
+        """Enable the screen cache and render to the given surface"""
+        self._screen = surface
+        self.screen = surface
+        self.screen_cache = True
+
+    def disable_screen_cache(self) -> None:
+        """Disable the screen cache and render to the window screen again"""
+        self._screen = None
+        self.screen = self._screen_ref
+        self.screen_cache = False
+
+    def as_ctx(self) -> tuple[int, int, float]:
+        """Get the hot frame state (width, height, dt) as one plain tuple
+
+        *Call once per frame to hand the state to compiled rendering
+        kernels in a single crossing instead of per attribute access*
+        """
+        return self.width, self.height, self.dt
+
+    def event_batch(self, events: list[pg.event.Event]) -> None:
+        """Handle all pygame events of a frame
 
-    # PROPERTIES
+        *Called once per frame by the window -
+        By default forwards each event to the event method,
+        override for batch processing without per event dispatch*
+        """
+
+        handler = self._event_hook
+        if handler is not None:
+            for event in events:
+                handler(event)
 
-    @property
-    def screen(self) -> pg.Surface:
-        return self._screen if self.screen_cache else self.window.screen
+    def mark_dirty(self, rect: pg.Rect = None) -> None:
+        """Mark the scene content as changed, so the next frame redraws instead of reusing the cache"""
+        self.dirty = True
+        if rect is not None:
+            self.dirty_rects.append(rect)
 
-    @property
-    def logger(self) -> logging.Logger:
-        return self.window.app.logger
+    def _bind_screen(self, surface: pg.Surface) -> None:
+        """Rebind the cached screen reference and reseed the cached dimensions
 
-    @property
-    def width(self) -> int:
-        return self.window.screen.get_width()
+        *Called by the window after the screen surface changes -
+        Don't call this method manually*
+        """
 
-    @property
-    def height(self) -> int:
-        return self.window.screen.get_height()
+        self._screen_ref = surface
+        if not self.screen_cache:
+            self.screen = surface
+        self._on_resize(*surface.get_size())
 
-    @property
-    def dimension(self) -> Vec:
-        return Vec(self.window.screen.get_width(), self.window.screen.get_height())
+    def _on_resize(self, width: int, height: int) -> None:
+        """Refresh the cached screen dimensions
+
+        *Called by the window on screen changes -
+        Don't call this method manually*
+        """
 
-    @property
-    def dt(self) -> float:
-        return self.window.clock.delta_time
+        self.width = width
+        self.height = height
+        self.dimension = Vec(width, height)
+        self.dimension_tuple = (width, height)
 
     # ABSTRACT METHODS
 
@@ -95,7 +95,7 @@ class Window:
 
     @property
     def dimension(self) -> Vec:
-        return Vec(self.screen.get_width(), self.screen.get_height())
+        return Vec(*self.screen.get_size())
 
     @property
     def dt(self) -> float:
@@ -119,36 +119,42 @@ class Window:
         pg.event.post(pg.event.Event(SCREEN_UPDATE_EVENT))
         self.init()
 
+        # Loop invariants as locals (the clock and the hook list are never rebound)
+        clock = self.clock
+        event_hooks = self.event_hooks
+
         # Window loop
         self.running = True
         while self.running:
 
             # Clock tick
-            self.clock.tick()
+            clock.tick()
+
+            # Delta time for the scenes (one write per frame instead of reads through window.clock)
+            if self.scene_mode:
+                self.scene.dt = clock.delta_time
+                if self.last_scene:
+                    self.last_scene.dt = clock.delta_time
 
             # Early update
             with time.benchmark(lambda result: setattr(self, "stat_e_update_time", result)):
                 self.early_update()
                 if self.scene_mode:
-                    self.scene.early_update()
-                    if self.last_scene:
-                        self.last_scene.early_update()
+                    if self.scene._early_update_hook:
+                        self.scene._early_update_hook()
+                    if self.last_scene and self.last_scene._early_update_hook:
+                        self.last_scene._early_update_hook()
 
             # Event handling
             with time.benchmark(lambda result: setattr(self, "stat_event_time", result)):
-                for event in pg.event.get():
+                events = pg.event.get()
+                for event in events:
 
                     # Window event handler
                     self.event(event)
 
-                    # Scene event handler
-                    if self.scene_mode:
-                        self.scene.event(event)
-                        if self.last_scene:
-                            self.last_scene.event(event)
-
                     # Event hooks
-                    for hook in self.event_hooks:
+                    for hook in event_hooks:
                         if event.type in hook.events:
                             for handler in hook.handlers:
                                 handler(event, self, hook.data)
@@ -156,14 +162,26 @@ class Window:
                     # Default event handlers
                     if event.type == pg.QUIT and self.auto_quit:
                         self.running = False
+                    elif event.type == pg.VIDEORESIZE and self.scene_mode:
+                        if self.scene:
+                            self.scene._on_resize(event.w, event.h)
+                        if self.last_scene:
+                            self.last_scene._on_resize(event.w, event.h)
+
+                # Scene event handlers (one batch call per frame instead of one call per event)
+                if self.scene_mode:
+                    self.scene.event_batch(events)
+                    if self.last_scene:
+                        self.last_scene.event_batch(events)
 
             # Update
             with time.benchmark(lambda result: setattr(self, "stat_update_time", result)):
                 self.update()
                 if self.scene_mode:
-                    self.scene.update()
-                    if self.last_scene:
-                        self.last_scene.update()
+                    if self.scene._update_hook:
+                        self.scene._update_hook()
+                    if self.last_scene and self.last_scene._update_hook:
+                        self.last_scene._update_hook()
 
             # Screen rendering
             with time.benchmark(lambda result: setattr(self, "stat_render_time", result)):
@@ -175,9 +193,10 @@ class Window:
             with time.benchmark(lambda result: setattr(self, "stat_l_update_time", result)):
                 self.late_update()
                 if self.scene_mode:
-                    self.scene.late_update()
-                    if self.last_scene:
-                        self.last_scene.late_update()
+                    if self.scene._late_update_hook:
+                        self.scene._late_update_hook()
+                    if self.last_scene and self.last_scene._late_update_hook:
+                        self.last_scene._late_update_hook()
 
             # Scene changing
             if self.next_scene_name != "":
@@ -192,6 +211,11 @@ class Window:
             if id(self.screen) != self.screen_id:
                 pg.event.post(pg.event.Event(SCREEN_UPDATE_EVENT))
                 self.screen_id: int = id(self.screen)
+                if self.scene_mode:
+                    if self.scene:
+                        self.scene._bind_screen(self.screen)
+                    if self.last_scene:
+                        self.last_scene._bind_screen(self.screen)
 
         # Shutdown
         self.logger.info("Close window ...")
@@ -226,8 +250,19 @@ class Window:
 
     def render_scene(self) -> None:
         """Render the scene and transition"""
-        # TODO: Scene rendering
-        self.scene.render()
+        # TODO: Transition rendering
+        scene = self.scene
+        scene._frame_counter += 1
+        if scene.screen_cache:
+            # Redraw into the cache surface only when the content changed
+            if scene.dirty:
+                scene.render()
+                scene.dirty = False
+                scene.dirty_rects.clear()
+            self.screen.blit(scene.screen, (0, 0))
+        elif scene.render_pending or scene.render_interval <= 1 or scene._frame_counter % scene.render_interval == 0:
+            scene.render()
+            scene.render_pending = False
 
     # ABSTRACT METHODS
 
@@ -39,9 +39,11 @@ setup(
     keywords="python, pygame, utils, framework, development",
     packages=find_packages(),
     python_requires=">=3.11, <4",
-    install_requires=["pygame"],
+    install_requires=["pygame", "numpy"],
     extras_require={
         "cv": ["opencv-python"],
+        "jit": ["numba"],
+        "gpu": ["cupy"],
     },
     # package_data={
     #     "sample": ["package_data.dat"],